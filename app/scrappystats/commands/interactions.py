@@ -5,23 +5,36 @@ These functions are intentionally independent of FastAPI / HTTP details.
 They operate purely on alliance_id / member_name and return formatted text
 using the v2 state layer and slash command formatters.
 """
+import copy
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
 
-from typing import Optional
+from typing import Any, Callable, Iterator, Mapping, Optional
 
 from ..storage.state import (
-    load_state,
+    load_state_cached,
+    state_scratch,
     record_pull_history,
     get_guild_name_overrides,
 )
 from ..models.member import Member
 from .slash_fullroster import full_roster_messages
 from .slash_service import service_record_command
-from ..discord_utils import interaction_response, send_followup_message
+from ..discord_utils import (
+    interaction_defer_response,
+    interaction_response,
+    send_followup_message,
+)
 from scrappystats.config import (
+    iter_alliances,
     load_config,
     list_alliances_for_guild,
     resolve_alliance_for_guild,
@@ -42,20 +55,41 @@ from ..utils import (
 )
 from ..webhook.sender import post_webhook_message
 from ..services.report_common import (
-    compute_deltas,
-    load_snapshot_at_or_after,
-    load_snapshot_at_or_before,
+    compute_member_delta,
+    snapshot_path_at_or_after,
+    snapshot_path_at_or_before,
 )
 
 
 log = logging.getLogger("scrappystats.forcepull")
 
+# Shared read-only fallback so ``x.get(...) or _EMPTY_DICT`` never allocates.
+_EMPTY_DICT = MappingProxyType({})
+
+_FOLLOWUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="followup")
+# Followups sent before Discord has the initial response get rejected.
+_FOLLOWUP_DELAY = 0.25
+_FORCEPULL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="forcepull")
+# Per-forcepull cap on concurrent roster fetches; request starts are still
+# spaced by the STFC.pro throttle in services.fetch.
+_FORCEPULL_FETCH_WORKERS = 4
+_FORCEPULL_INFLIGHT: set[str] = set()
+_FORCEPULL_LOCK = threading.Lock()
+# Guilds can share an alliance; never scrape and sync one alliance twice at once.
+_ALLIANCE_SYNC_LOCKS: dict[str, threading.Lock] = {}
+
+
+def _alliance_sync_lock(alliance_id: str) -> threading.Lock:
+    with _FORCEPULL_LOCK:
+        return _ALLIANCE_SYNC_LOCKS.setdefault(str(alliance_id), threading.Lock())
+
+
 def _format_pull_timestamp(raw: str | None) -> str:
     if not raw:
         return "Unknown time"
     value = str(raw)
     try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         parsed = parsed.astimezone(timezone.utc)
@@ -63,6 +97,15 @@ def _format_pull_timestamp(raw: str | None) -> str:
     except ValueError:
         return value
 
+def _log_task_failure(future: Future) -> None:
+    """Done callback: surface exceptions that would otherwise stay in the Future."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        log.error("Background task failed", exc_info=exc)
+
+
 def _send_followups_async(
     app_id: Optional[str],
     token: Optional[str],
@@ -71,13 +114,62 @@ def _send_followups_async(
 ) -> None:
     if not messages:
         return
+    future = _FOLLOWUP_POOL.submit(
+        _send_followups,
+        app_id,
+        token,
+        tuple(messages),
+        ephemeral,
+        time.monotonic(),
+    )
+    future.add_done_callback(_log_task_failure)
+
+
+def _send_followups(
+    app_id: Optional[str],
+    token: Optional[str],
+    messages: tuple[str, ...],
+    ephemeral: bool,
+    queued_at: float,
+) -> None:
+    # Give Discord a moment to register the initial response first, counting
+    # time already spent queued or building the messages.
+    remaining = _FOLLOWUP_DELAY - (time.monotonic() - queued_at)
+    if remaining > 0:
+        time.sleep(remaining)
+    for message in messages:
+        send_followup_message(app_id, token, message, ephemeral=ephemeral)
+
+
+def _defer_with_followups(payload: dict, build: Callable[[], list[str]]) -> dict:
+    """Acknowledge the interaction now and send build()'s messages as followups.
+
+    Keeps slow handlers clear of Discord's three second response deadline.
+    """
+    future = _FOLLOWUP_POOL.submit(
+        _build_and_send_followups,
+        payload.get("application_id"),
+        payload.get("token"),
+        build,
+        time.monotonic(),
+    )
+    future.add_done_callback(_log_task_failure)
+    return interaction_defer_response(ephemeral=True)
+
 
-    def _send():
-        time.sleep(0.25)
-        for message in messages:
-            send_followup_message(app_id, token, message, ephemeral=ephemeral)
+def _build_and_send_followups(
+    app_id: Optional[str],
+    token: Optional[str],
+    build: Callable[[], list[str]],
+    queued_at: float,
+) -> None:
+    try:
+        messages = build()
+    except Exception:
+        log.exception("Deferred command failed")
+        messages = ["⚠️ Scrappy encountered an error while executing that command."]
+    _send_followups(app_id, token, tuple(messages), True, queued_at)
 
-    threading.Thread(target=_send, daemon=True).start()
 
 def _alliance_label(alliance: dict) -> str:
     name = alliance.get("name") or alliance.get("alliance_name") or "Unknown"
@@ -129,7 +221,7 @@ def _alliance_failure_message(
 
 def _get_subcommand_name(payload: dict) -> Optional[str]:
     data = payload.get("data", {})
-    options = data.get("options") or []
+    options = data.get("options") or ()
     if not options:
         return None
     return options[0].get("name")
@@ -137,13 +229,13 @@ def _get_subcommand_name(payload: dict) -> Optional[str]:
 
 def _get_subcommand_options(payload: dict) -> list[dict]:
     data = payload.get("data", {})
-    options = data.get("options") or []
+    options = data.get("options") or ()
     if not options:
         return []
     sub = options[0]
     return [
         {"name": opt.get("name"), "value": opt.get("value")}
-        for opt in (sub.get("options") or [])
+        for opt in (sub.get("options") or ())
         if opt.get("name") and "value" in opt
     ]
 
@@ -204,12 +296,34 @@ def _resolve_alliances(config: dict, guild_id: str) -> list[dict]:
     alliances = list_alliances_for_guild(config, guild_id)
     if alliances:
         return alliances
-    guilds = config.get("guilds") or []
+    guilds = config.get("guilds") or ()
     if guilds:
         return []
     return config.get("alliances", []) or []
 
 
+def _members_values(state: dict):
+    """Iterate raw member dicts without allocating a placeholder when empty."""
+    members = state.get("members")
+    return members.values() if members else ()
+
+
+def _load_members(alliance_id: str) -> tuple[dict, list[Member]]:
+    """Return the cached state and its deserialized members.
+
+    Members are rebuilt only when load_state_cached() hands back a new
+    state object, i.e. when the state file changed on disk.
+    """
+    state = load_state_cached(alliance_id)
+    scratch = state_scratch(state)
+    members = scratch.get("members")
+    if members is None:
+        members = scratch["members"] = [
+            _member_from_raw(state, data) for data in _members_values(state)
+        ]
+    return state, members
+
+
 def handle_player_autocomplete(payload: dict, query: str) -> list[dict]:
     guild_id = payload.get("guild_id") or "default"
     config = load_config()
@@ -217,20 +331,43 @@ def handle_player_autocomplete(payload: dict, query: str) -> list[dict]:
     alliance, _ = _resolve_alliance_selection(config, guild_id, selection)
     if not alliance:
         return []
-    state = load_state(alliance.get("id", guild_id))
-    overrides = get_guild_name_overrides(state, guild_id)
-    members_raw = (state.get("members") or {}).values()
-    names = []
-    for data in members_raw:
-        member = Member.from_json(data)
-        display_name = overrides.get(member.uuid, member.name)
-        if display_name:
-            names.append(display_name)
-    names = sorted(set(names), key=str.lower)
+    state = load_state_cached(alliance.get("id", guild_id))
+    names = _autocomplete_names(state, guild_id)
     if query:
-        needle = query.lower()
-        names = [name for name in names if needle in name.lower()]
-    return [{"name": name, "value": name} for name in names[:25]]
+        needle = query.casefold()
+        matches = []
+        for folded, name in names:
+            if needle in folded:
+                matches.append(name)
+                if len(matches) == 25:
+                    break
+    else:
+        matches = [name for _, name in names[:25]]
+    return [{"name": name, "value": name} for name in matches]
+
+
+def _autocomplete_names(state: dict, guild_id: str) -> list[tuple[str, str]]:
+    """Sorted (casefolded, display name) pairs for a guild, built once per state."""
+    by_guild = state_scratch(state).setdefault("autocomplete", {})
+    key = str(guild_id)
+    names = by_guild.get(key)
+    if names is None:
+        overrides = get_guild_name_overrides(state, guild_id)
+        # Offer a member's display name only if looking it up finds that same
+        # member; otherwise fall back to their current name. Names that
+        # resolve elsewhere (e.g. an override shadowed by another member's
+        # current name) are skipped so no entry opens the wrong member.
+        display_names: dict[str, str] = {}
+        for data in _members_values(state):
+            for candidate in (overrides.get(data.get("uuid")), data.get("name")):
+                if not candidate:
+                    continue
+                folded = candidate.casefold()
+                if _resolve_raw_member(state, folded, guild_id) is data:
+                    display_names.setdefault(folded, candidate)
+                    break
+        names = by_guild[key] = sorted(display_names.items(), key=itemgetter(0))
+    return names
 
 
 def handle_alliance_autocomplete(payload: dict, query: str) -> list[dict]:
@@ -250,6 +387,108 @@ def handle_alliance_autocomplete(payload: dict, query: str) -> list[dict]:
         choices = [choice for choice in choices if needle in choice["name"].lower()]
     return choices[:25]
 
+def _forcepull_payload(
+    alliance: dict,
+    alliance_id: str,
+    *,
+    debug: bool,
+    pull_timestamp: str,
+) -> dict | None:
+    """Fetch (or load test data for) one alliance and build its sync payload.
+
+    Returns None when test mode has no roster; that failure is recorded here.
+    """
+    if is_test_mode_enabled(alliance):
+        test_payload = load_test_roster(alliance_id)
+        if not test_payload:
+            record_pull_history(alliance_id, pull_timestamp, False, source="test")
+            log.error(
+                "Forcepull failed: no test data available for alliance %s",
+                alliance_id,
+            )
+            return None
+        roster, test_timestamp, test_message, test_file = test_payload
+        log.info(
+            "Forcepull test mode using %s members at %s for alliance %s.",
+            len(roster),
+            test_timestamp,
+            alliance_id,
+        )
+        post_webhook_message(
+            format_test_mode_webhook(test_file, test_message),
+            alliance_id=alliance_id,
+        )
+        payload = {
+            "id": alliance_id,
+            "alliance_name": alliance.get("alliance_name") or alliance.get("name"),
+            "scraped_members": roster,
+            "scrape_timestamp": test_timestamp,
+            "pull_source": "test",
+        }
+        return payload
+
+    roster = fetch_alliance_roster(
+        alliance_id,
+        debug=debug,
+        scrape_stamp=pull_timestamp,
+    )
+    payload = {
+        "id": alliance_id,
+        "alliance_name": alliance.get("alliance_name") or alliance.get("name"),
+        "scraped_members": roster,
+        "scrape_timestamp": pull_timestamp,
+        "pull_source": "forcepull",
+    }
+    return payload
+
+
+def _fetch_and_sync(
+    guild_id: str,
+    locked: list[tuple[dict, str, threading.Lock]],
+    *,
+    debug: bool,
+    pull_timestamp: str,
+) -> None:
+    """Scrape alliances concurrently, then sync them one at a time in config order.
+
+    Fetches overlap on a small pool. The shared throttle in services.fetch
+    still spaces out when each STFC.pro request starts, so the fan-out only
+    overlaps time spent waiting on responses.
+    """
+    if not locked:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(_FORCEPULL_FETCH_WORKERS, len(locked)),
+        thread_name_prefix="forcepull-fetch",
+    ) as fetch_pool:
+        futures = [
+            fetch_pool.submit(
+                _forcepull_payload,
+                alliance,
+                alliance_id,
+                debug=debug,
+                pull_timestamp=pull_timestamp,
+            )
+            for alliance, alliance_id, _ in locked
+        ]
+        for (alliance, alliance_id, _), future in zip(locked, futures):
+            try:
+                payload = future.result()
+                if payload is None:
+                    continue
+                # This function must be the SAME one cron/startup uses; it
+                # records the successful pull along with the synced state.
+                run_alliance_sync(payload)
+            except Exception:
+                log.exception("Forcepull failed for alliance %s (guild %s)", alliance_id, guild_id)
+                record_pull_history(
+                    alliance_id,
+                    pull_timestamp or scrape_timestamp(),
+                    False,
+                    source="test" if is_test_mode_enabled(alliance) else "forcepull",
+                )
+
+
 def _run_forcepull(guild_id: str, alliance_selection: Optional[str] = None):
     alliance_id = None
     pull_timestamp = None
@@ -279,71 +518,28 @@ def _run_forcepull(guild_id: str, alliance_selection: Optional[str] = None):
         pull_timestamp = scrape_timestamp()
         log.info("Forcepull started for guild %s (%s alliances)", guild_id, len(alliances))
 
+        locked = []
         for alliance in alliances:
             alliance_id = alliance.get("id")
             if not alliance_id:
                 log.error("Forcepull skipped for guild %s: alliance missing id", guild_id)
                 continue
 
-            try:
-                if is_test_mode_enabled(alliance):
-                    test_payload = load_test_roster(alliance_id)
-                    if not test_payload:
-                        record_pull_history(alliance_id, pull_timestamp, False, source="test")
-                        log.error(
-                            "Forcepull failed: no test data available for alliance %s",
-                            alliance_id,
-                        )
-                        continue
-                    roster, test_timestamp, test_message, test_file = test_payload
-                    source = "test"
-                    log.info(
-                        "Forcepull test mode using %s members at %s for alliance %s.",
-                        len(roster),
-                        test_timestamp,
-                        alliance_id,
-                    )
-                    post_webhook_message(
-                        format_test_mode_webhook(test_file, test_message),
-                        alliance_id=alliance_id,
-                    )
-                    payload = {
-                        "id": alliance_id,
-                        "alliance_name": alliance.get("alliance_name") or alliance.get("name"),
-                        "scraped_members": roster,
-                        "scrape_timestamp": test_timestamp,
-                    }
-                else:
-                    roster = fetch_alliance_roster(
-                        alliance_id,
-                        debug=debug,
-                        scrape_stamp=pull_timestamp,
-                    )
-                    source = "forcepull"
-                    payload = {
-                        "id": alliance_id,
-                        "alliance_name": alliance.get("alliance_name") or alliance.get("name"),
-                        "scraped_members": roster,
-                        "scrape_timestamp": pull_timestamp,
-                    }
-
-                # This function must be the SAME one cron/startup uses.
-                data_changed = run_alliance_sync(payload)
-                record_pull_history(
-                    alliance_id,
-                    payload["scrape_timestamp"],
-                    True,
-                    source=source,
-                    data_changed=data_changed,
-                )
-            except Exception:
-                log.exception("Forcepull failed for alliance %s (guild %s)", alliance_id, guild_id)
-                record_pull_history(
+            sync_lock = _alliance_sync_lock(alliance_id)
+            if not sync_lock.acquire(blocking=False):
+                log.info(
+                    "Forcepull skipped for alliance %s (guild %s): sync already running",
                     alliance_id,
-                    pull_timestamp or scrape_timestamp(),
-                    False,
-                    source="test" if alliance and is_test_mode_enabled(alliance) else "forcepull",
+                    guild_id,
                 )
+                continue
+            locked.append((alliance, alliance_id, sync_lock))
+
+        try:
+            _fetch_and_sync(guild_id, locked, debug=debug, pull_timestamp=pull_timestamp)
+        finally:
+            for _, _, sync_lock in locked:
+                sync_lock.release()
 
         log.info("Forcepull completed for guild %s", guild_id)
 
@@ -351,7 +547,11 @@ def _run_forcepull(guild_id: str, alliance_selection: Optional[str] = None):
         log.exception("Forcepull failed for guild %s", guild_id)
         if alliance_id:
             record_pull_history(alliance_id, pull_timestamp or scrape_timestamp(), False, source="forcepull")
-        
+    finally:
+        with _FORCEPULL_LOCK:
+            _FORCEPULL_INFLIGHT.discard(guild_id)
+
+
 def handle_forcepull(payload: dict):
     guild_id = payload.get("guild_id")
 
@@ -361,12 +561,22 @@ def handle_forcepull(payload: dict):
             ephemeral=True,
         )
 
+    with _FORCEPULL_LOCK:
+        if guild_id in _FORCEPULL_INFLIGHT:
+            return interaction_response(
+                "🛠 **Force pull already running**\nScrappy is still syncing this server's alliance data.",
+                ephemeral=True,
+            )
+        _FORCEPULL_INFLIGHT.add(guild_id)
+
     alliance_selection = _get_subcommand_option(payload, "alliance")
-    threading.Thread(
-        target=_run_forcepull,
-        args=(guild_id, alliance_selection),
-        daemon=True,
-    ).start()
+    try:
+        future = _FORCEPULL_POOL.submit(_run_forcepull, guild_id, alliance_selection)
+    except RuntimeError:
+        with _FORCEPULL_LOCK:
+            _FORCEPULL_INFLIGHT.discard(guild_id)
+        raise
+    future.add_done_callback(_log_task_failure)
 
     return interaction_response(
         "🛠 **Force pull started**\nScrappy is fetching and syncing alliance data.",
@@ -374,35 +584,166 @@ def handle_forcepull(payload: dict):
     )
 
 
-def handle_fullroster(payload: dict) -> dict:
-    """Return a formatted full roster response for the given guild."""
+@dataclass(frozen=True)
+class _InteractionContext:
+    config: dict
+    guild_id: str
+    alliance: dict
+    options: dict
+
+    @property
+    def alliance_id(self) -> str:
+        return self.alliance.get("id", self.guild_id)
+
+
+def _prepare_context(payload: dict, action: str) -> _InteractionContext | dict:
+    """Resolve config and alliance for a slash command once per interaction.
+
+    Returns an interaction response instead when no alliance could be resolved.
+    """
     guild_id = payload.get("guild_id") or "default"
     config = load_config()
-    selection = _get_subcommand_option(payload, "alliance")
+    options = _subcommand_option_values(payload)
+    selection = options.get("alliance")
     alliance, alliances = _resolve_alliance_selection(config, guild_id, selection)
     if not alliance:
         if alliances and not selection:
-            return _prompt_alliance_selection(payload, "Full roster", alliances)
+            return _prompt_alliance_selection(payload, action, alliances)
         return interaction_response(
-            _alliance_failure_message("Full roster", alliances, selection),
+            _alliance_failure_message(action, alliances, selection),
             ephemeral=True,
         )
-    state = load_state(alliance.get("id", guild_id))
-    overrides = get_guild_name_overrides(state, guild_id)
-    service_state = _load_service_state(alliance.get("id", guild_id))
+    return _InteractionContext(
+        config=config,
+        guild_id=guild_id,
+        alliance=alliance,
+        options=options,
+    )
+
+
+def handle_fullroster(payload: dict) -> dict:
+    """Return a formatted full roster response for the given guild."""
+    ctx = _prepare_context(payload, "Full roster")
+    if isinstance(ctx, dict):
+        return ctx
+    return _defer_with_followups(payload, partial(_fullroster_messages, ctx))
+
+
+def _fullroster_messages(ctx: _InteractionContext) -> list[str]:
+    state, members = _load_members(ctx.alliance_id)
+    overrides = get_guild_name_overrides(state, ctx.guild_id)
+    service_state = _load_service_state(ctx.alliance_id)
     active_names = set(service_state.keys())
-    messages = full_roster_messages(
+    return full_roster_messages(
         state,
         service_state=service_state,
         name_overrides=overrides,
         active_names=active_names,
+        members=members,
     )
-    primary = messages[0]
-    if len(messages) > 1:
-        app_id = payload.get("application_id")
-        token = payload.get("token")
-        _send_followups_async(app_id, token, messages[1:], ephemeral=True)
-    return interaction_response(primary, ephemeral=True)
+
+
+def _member_from_raw(state: dict, data: dict) -> Member:
+    """Deserialize a raw member of ``state`` at most once per state object.
+
+    The Member is shared between callers; copy it before changing fields.
+    """
+    # id(data) is stable here: the state (cached with the entry) keeps data alive.
+    by_id = state_scratch(state).setdefault("member_by_id", {})
+    member = by_id.get(id(data))
+    if member is None:
+        member = by_id[id(data)] = Member.from_json(data)
+    return member
+
+
+def _build_name_index(state: dict) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Index raw member dicts by casefolded current and previous names."""
+    by_name: dict[str, dict] = {}
+    by_prev: dict[str, dict] = {}
+    for data in _members_values(state):
+        name = data.get("name")
+        if name:
+            by_name.setdefault(name.casefold(), data)
+        for prev in data.get("previous_names") or ():
+            if prev:
+                by_prev.setdefault(prev.casefold(), data)
+    return by_name, by_prev
+
+
+def _name_index(state: dict) -> tuple[dict[str, dict], dict[str, dict]]:
+    scratch = state_scratch(state)
+    index = scratch.get("names")
+    if index is None:
+        index = scratch["names"] = _build_name_index(state)
+    return index
+
+
+def _override_index(state: dict, guild_id: Optional[str]) -> dict[str, dict]:
+    """Index raw member dicts by casefolded guild override name."""
+    by_guild = state_scratch(state).setdefault("overrides", {})
+    key = str(guild_id)
+    index = by_guild.get(key)
+    if index is None:
+        index = {}
+        members_raw = state.get("members") or _EMPTY_DICT
+        for member_uuid, override in get_guild_name_overrides(state, guild_id).items():
+            data = members_raw.get(member_uuid)
+            if override and data is not None:
+                index.setdefault(override.casefold(), data)
+        by_guild[key] = index
+    return index
+
+
+def _rename_index(state: dict) -> dict[str, list[dict]]:
+    """Map member uuid -> rename events in time order, for renamed members only."""
+    scratch = state_scratch(state)
+    index = scratch.get("renames")
+    if index is None:
+        index = {}
+        for member_uuid, data in (state.get("members") or _EMPTY_DICT).items():
+            events = [ev for ev in data.get("events") or () if ev.get("type") == "rename"]
+            if not events:
+                continue
+            # add_service_event appends in time order, so only legacy data needs sorting.
+            timestamps = [ev.get("timestamp", "") for ev in events]
+            if any(a > b for a, b in zip(timestamps, timestamps[1:])):
+                keyed = sorted(zip(timestamps, events), key=itemgetter(0))
+                events = [ev for _, ev in keyed]
+            index[member_uuid] = events
+        scratch["renames"] = index
+    return index
+
+
+def warm_caches() -> None:
+    """Load config and every configured alliance's state ahead of the first interaction."""
+    config = load_config()
+    for guild in config.get("guilds") or ():
+        list_alliances_for_guild(config, str(guild.get("id")))
+    for alliance in iter_alliances(config):
+        alliance_id = alliance.get("id")
+        if not alliance_id:
+            continue
+        try:
+            state, _ = _load_members(alliance_id)
+            _name_index(state)
+            _rename_index(state)
+        except Exception:
+            log.exception("Cache warm-up failed for alliance %s", alliance_id)
+
+
+def _resolve_raw_member(
+    state: dict,
+    folded: str,
+    guild_id: Optional[str],
+) -> Optional[dict]:
+    """Raw member dict a casefolded name resolves to: name > override > previous."""
+    by_name, by_prev = _name_index(state)
+    data = by_name.get(folded)
+    if data is None:
+        data = _override_index(state, guild_id).get(folded)
+    if data is None:
+        data = by_prev.get(folded)
+    return data
 
 
 def _find_member_by_name(
@@ -411,23 +752,16 @@ def _find_member_by_name(
     *,
     guild_id: Optional[str] = None,
 ) -> Optional[Member]:
-    """Find a Member by (case-insensitive) exact name match.
+    """Find a Member by (casefolded) exact name match.
 
-    Returns the first Member instance with matching name, or None if not found.
+    Current names win over guild overrides, which win over previous names.
+    Player autocomplete only offers names that resolve back to the member
+    they were shown for. Returns None if nothing matches.
     """
-    target = name.lower()
-    guild_overrides = get_guild_name_overrides(state, guild_id)
-    members_raw = (state.get("members") or {}).values()
-    for data in members_raw:
-        m = Member.from_json(data)
-        if m.name.lower() == target:
-            return m
-        if any(prev.lower() == target for prev in (m.previous_names or [])):
-            return m
-        override = guild_overrides.get(m.uuid, "")
-        if override and override.lower() == target:
-            return m
-    return None
+    data = _resolve_raw_member(state, name.casefold(), guild_id)
+    if data is None:
+        return None
+    return _member_from_raw(state, data)
 
 
 def _display_member_name(member: Member, guild_overrides: dict) -> str:
@@ -438,33 +772,50 @@ def _load_service_state(alliance_id: str) -> dict:
     return load_json(report_state_path(alliance_id), {})
 
 
-def _member_contributions_since(
-    alliance_id: str,
-    member_name: str,
-    *,
-    days: int,
-) -> dict:
-    now = datetime.now(timezone.utc)
-    end_snapshot = load_snapshot_at_or_before(alliance_id, now)
-    current = end_snapshot or _load_service_state(alliance_id)
-    start_dt = now - timedelta(days=days)
-    start_snapshot = load_snapshot_at_or_before(alliance_id, start_dt)
-    if not start_snapshot:
-        start_snapshot = load_snapshot_at_or_after(alliance_id, start_dt)
-    previous = start_snapshot or current
-    deltas = compute_deltas(current, previous)
-    return deltas.get(
-        member_name,
-        {"helps": 0, "rss": 0, "iso": 0, "resources_mined": 0},
-    )
+class _SnapshotCache:
+    """Request-scoped history reader: each snapshot file is parsed at most once."""
 
+    def __init__(self, alliance_id: str):
+        self.alliance_id = alliance_id
+        self._loaded: dict[Path, dict] = {}
 
-def _member_total_contributions(alliance_id: str, member_name: str) -> dict:
-    service_state = _load_service_state(alliance_id)
-    return service_state.get(
-        member_name,
-        {"helps": 0, "rss": 0, "iso": 0, "resources_mined": 0},
-    )
+    def _load(self, path: Path | None) -> dict:
+        if path is None:
+            return {}
+        snapshot = self._loaded.get(path)
+        if snapshot is None:
+            snapshot = self._loaded[path] = load_json(path, {})
+        return snapshot
+
+    def at_or_before(self, target_dt: datetime) -> dict:
+        return self._load(snapshot_path_at_or_before(self.alliance_id, target_dt))
+
+    def at_or_after(self, target_dt: datetime) -> dict:
+        return self._load(snapshot_path_at_or_after(self.alliance_id, target_dt))
+
+
+_NO_CONTRIBUTIONS = MappingProxyType({"helps": 0, "rss": 0, "iso": 0, "resources_mined": 0})
+
+
+def _collect_contributions_bundle(
+    snapshots: _SnapshotCache,
+    member_name: str,
+    service_state: dict,
+    now: datetime,
+) -> dict[str, Mapping[str, Any]]:
+    """Return a member's total and 30/7/1 day contributions.
+
+    The latest snapshot is loaded once and shared by all three windows.
+    """
+    current = snapshots.at_or_before(now) or service_state
+    bundle = {"total": service_state.get(member_name, _NO_CONTRIBUTIONS)}
+    for key, days in (("d30", 30), ("d7", 7), ("d1", 1)):
+        start_dt = now - timedelta(days=days)
+        start_snapshot = snapshots.at_or_before(start_dt) or snapshots.at_or_after(start_dt)
+        previous = start_snapshot or current
+        delta = compute_member_delta(current, previous, member_name)
+        bundle[key] = _NO_CONTRIBUTIONS if delta is None else delta
+    return bundle
 
 def _parse_report_timestamp(raw: str | None) -> datetime | None:
     if not raw:
@@ -473,26 +824,23 @@ def _parse_report_timestamp(raw: str | None) -> datetime | None:
     if value.endswith("Z") and "+" in value:
         value = value[:-1]
     try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(value)
     except ValueError:
-        try:
-            parsed_date = datetime.fromisoformat(value)
-            parsed = parsed_date.replace(tzinfo=timezone.utc)
-        except ValueError:
-            return None
+        return None
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=timezone.utc)
     return parsed.astimezone(timezone.utc)
 
 def _member_stat_at_or_before(
-    alliance_id: str,
+    snapshots: _SnapshotCache,
     member_name: str,
     target_dt: datetime,
-) -> dict:
-    snapshot = load_snapshot_at_or_before(alliance_id, target_dt)
+) -> Mapping[str, Any]:
+    """Read-only stats for a member from the snapshot at or before target_dt."""
+    snapshot = snapshots.at_or_before(target_dt)
     if not snapshot:
-        return {}
-    return snapshot.get(member_name, {}) or {}
+        return _EMPTY_DICT
+    return snapshot.get(member_name) or _EMPTY_DICT
 
 def _stat_gain(current: int, baseline: int | None) -> int:
     if baseline is None:
@@ -511,17 +859,16 @@ def handle_service_record(
 
     If the member is not found, returns a friendly error string rather than raising.
     """
-    state = load_state(alliance_id)
+    state = load_state_cached(alliance_id)
     member = _find_member_by_name(state, player_name, guild_id=guild_id)
     if not member:
         return f"Scrappy tilts his head — I can't find any officer named '{player_name}', Captain."
-    contributions_total = _member_total_contributions(alliance_id, member.name)
-    contributions_30 = _member_contributions_since(alliance_id, member.name, days=30)
-    contributions_7 = _member_contributions_since(alliance_id, member.name, days=7)
-    contributions_1 = _member_contributions_since(alliance_id, member.name, days=1)
+    now = datetime.now(timezone.utc)
     service_state = _load_service_state(alliance_id)
+    snapshots = _SnapshotCache(alliance_id)
+    contributions = _collect_contributions_bundle(snapshots, member.name, service_state, now)
     is_active_member = member.name in service_state
-    member_state = service_state.get(member.name, {}) or {}
+    member_state = service_state.get(member.name) or _EMPTY_DICT
     current_power = int(member_state.get("power", member.power) or 0)
     max_power = int(member_state.get("max_power", current_power) or 0)
     power_destroyed = int(member_state.get("power_destroyed", 0) or 0)
@@ -531,14 +878,13 @@ def handle_service_record(
     resources_mined = int(member_state.get("resources_mined", 0) or 0)
     alliance_helps_sent = int(member_state.get("alliance_helps_sent", 0) or 0)
 
-    now = datetime.now(timezone.utc)
-    start_of_today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
-    stats_today = _member_stat_at_or_before(alliance_id, member.name, start_of_today)
-    stats_7 = _member_stat_at_or_before(alliance_id, member.name, now - timedelta(days=7))
-    stats_30 = _member_stat_at_or_before(alliance_id, member.name, now - timedelta(days=30))
+    start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    stats_today = _member_stat_at_or_before(snapshots, member.name, start_of_today)
+    stats_7 = _member_stat_at_or_before(snapshots, member.name, now - timedelta(days=7))
+    stats_30 = _member_stat_at_or_before(snapshots, member.name, now - timedelta(days=30))
     last_join_dt = _parse_report_timestamp(member.last_join_date)
     power_since_join = (
-        _member_stat_at_or_before(alliance_id, member.name, last_join_dt).get("power")
+        _member_stat_at_or_before(snapshots, member.name, last_join_dt).get("power")
         if last_join_dt
         else None
     )
@@ -546,7 +892,8 @@ def handle_service_record(
     overrides = get_guild_name_overrides(state, guild_id)
     display_name = _display_member_name(member, overrides)
     if display_name != member.name:
-        member = Member.from_json(member.to_json())
+        # Shallow copy: the cached Member is shared, only the name changes here.
+        member = copy.copy(member)
         member.name = display_name
     message = service_record_command(
         member,
@@ -562,10 +909,10 @@ def handle_service_record(
         power_today=_stat_gain(current_power, stats_today.get("power")),
         power_7=_stat_gain(current_power, stats_7.get("power")),
         power_30=_stat_gain(current_power, stats_30.get("power")),
-        contributions_total=contributions_total,
-        contributions_30=contributions_30,
-        contributions_7=contributions_7,
-        contributions_1=contributions_1,
+        contributions_total=contributions["total"],
+        contributions_30=contributions["d30"],
+        contributions_7=contributions["d7"],
+        contributions_1=contributions["d1"],
     )
     if not is_active_member:
         alliance_label = (alliance_name or "THIS ALLIANCE").upper()
@@ -573,77 +920,66 @@ def handle_service_record(
     return message
 
 
-def _get_subcommand_option(payload: dict, option_name: str) -> Optional[str]:
+def _subcommand_option_values(payload: dict) -> dict:
+    """Map option name -> value for the invoked subcommand."""
     data = payload.get("data", {})
-    options = data.get("options") or []
+    options = data.get("options") or ()
     if not options:
-        return None
-    sub = options[0]
-    for opt in sub.get("options") or []:
-        if opt.get("name") == option_name:
-            return opt.get("value")
-    return None
+        return {}
+    return {opt.get("name"): opt.get("value") for opt in (options[0].get("options") or ())}
+
+
+def _get_subcommand_option(payload: dict, option_name: str) -> Optional[str]:
+    return _subcommand_option_values(payload).get(option_name)
 
 
 def handle_service_record_slash(payload: dict) -> dict:
-    guild_id = payload.get("guild_id") or "default"
-    config = load_config()
-    selection = _get_subcommand_option(payload, "alliance")
-    alliance, alliances = _resolve_alliance_selection(config, guild_id, selection)
-    if not alliance:
-        if alliances and not selection:
-            return _prompt_alliance_selection(payload, "Service record", alliances)
-        return interaction_response(
-            _alliance_failure_message("Service record", alliances, selection),
-            ephemeral=True,
-        )
-    player_name = _get_subcommand_option(payload, "player")
+    ctx = _prepare_context(payload, "Service record")
+    if isinstance(ctx, dict):
+        return ctx
+    player_name = ctx.options.get("player")
     if not player_name:
         return interaction_response(
             "❌ Service record failed: provide a player name.",
             ephemeral=True,
         )
-    alliance_id = alliance.get("id", guild_id)
+    return _defer_with_followups(payload, partial(_service_record_messages, ctx, player_name))
+
+
+def _service_record_messages(ctx: _InteractionContext, player_name: str) -> list[str]:
     message = handle_service_record(
-        alliance_id,
+        ctx.alliance_id,
         player_name,
-        guild_id=guild_id,
-        alliance_name=alliance.get("alliance_name") or alliance.get("name"),
+        guild_id=ctx.guild_id,
+        alliance_name=ctx.alliance.get("alliance_name") or ctx.alliance.get("name"),
     )
-    return interaction_response(message, ephemeral=True)
+    return [message]
 
 
 def _chunk_lines(lines: list[str], limit: int = 1900) -> list[str]:
     chunks: list[str] = []
-    current: list[str] = []
-    current_len = 0
-    for line in lines:
-        line_len = len(line)
-        extra = line_len + (1 if current else 0)
-        if current and current_len + extra > limit:
-            chunks.append("\n".join(current))
-            current = [line]
-            current_len = line_len
-            continue
-        current.append(line)
-        current_len += extra
-    if current:
-        chunks.append("\n".join(current))
+    start = 0
+    # Start at -1 so the first line is not charged a joining newline.
+    running = -1
+    for idx, line_len in enumerate(map(len, lines)):
+        running += line_len + 1
+        if running > limit and idx > start:
+            chunks.append("\n".join(lines[start:idx]))
+            start = idx
+            running = line_len
+    if start < len(lines):
+        chunks.append("\n".join(lines[start:]))
     return chunks
 
 
-def _member_name_change_lines(member: Member) -> list[str]:
+def _member_name_change_lines(member: Member, rename_events: list[dict]) -> list[str]:
     lines = [f"🗂 **Name changes for {member.name}**"]
-    rename_events = [
-        ev for ev in (member.service_events or []) if ev.get("type") == "rename"
-    ]
     if rename_events:
-        rename_events.sort(key=lambda ev: ev.get("timestamp", ""))
-        for ev in rename_events:
-            ts = ev.get("timestamp", "")
-            old_name = ev.get("old_name", "Unknown")
-            new_name = ev.get("new_name", member.name)
-            lines.append(f"- {ts} — {old_name} → **{new_name}**")
+        lines.extend(
+            f"- {ev.get('timestamp', '')} — {ev.get('old_name', 'Unknown')}"
+            f" → **{ev.get('new_name', member.name)}**"
+            for ev in rename_events
+        )
     elif member.previous_names:
         lines.append(f"Previous names: {', '.join(member.previous_names)}")
     else:
@@ -651,32 +987,32 @@ def _member_name_change_lines(member: Member) -> list[str]:
     return lines
 
 
-def _collect_name_change_members(state: dict) -> list[Member]:
-    members: list[Member] = []
-    for data in (state.get("members") or {}).values():
-        member = Member.from_json(data)
-        if member.previous_names or any(
-            ev.get("type") == "rename" for ev in (member.service_events or [])
-        ):
-            members.append(member)
-    members.sort(key=lambda m: m.name.lower())
-    return members
+def _iter_rename_candidates(state: dict) -> Iterator[tuple[str, str]]:
+    """Yield (name, previous names) for renamed members, sorted by name.
+
+    Works on the raw dicts; the filtered, sorted list is built once per state.
+    """
+    scratch = state_scratch(state)
+    matches = scratch.get("name_changes")
+    if matches is None:
+        renamed = _rename_index(state)
+        keyed = [
+            (str(data.get("name") or "").casefold(), data)
+            for member_uuid, data in (state.get("members") or _EMPTY_DICT).items()
+            if data.get("previous_names") or member_uuid in renamed
+        ]
+        keyed.sort(key=itemgetter(0))
+        matches = scratch["name_changes"] = [data for _, data in keyed]
+    for data in matches:
+        yield data.get("name"), ", ".join(data.get("previous_names") or ())
 
 
 def handle_name_changes_slash(payload: dict) -> dict:
-    guild_id = payload.get("guild_id") or "default"
-    config = load_config()
-    selection = _get_subcommand_option(payload, "alliance")
-    alliance, alliances = _resolve_alliance_selection(config, guild_id, selection)
-    if not alliance:
-        if alliances and not selection:
-            return _prompt_alliance_selection(payload, "Name change lookup", alliances)
-        return interaction_response(
-            _alliance_failure_message("Name change lookup", alliances, selection),
-            ephemeral=True,
-        )
-    state = load_state(alliance.get("id", guild_id))
-    player_name = _get_subcommand_option(payload, "player")
+    ctx = _prepare_context(payload, "Name change lookup")
+    if isinstance(ctx, dict):
+        return ctx
+    state = load_state_cached(ctx.alliance_id)
+    player_name = ctx.options.get("player")
     if player_name:
         member = _find_member_by_name(state, player_name)
         if not member:
@@ -684,21 +1020,18 @@ def handle_name_changes_slash(payload: dict) -> dict:
                 f"Scrappy tilts his head — I can't find any officer named '{player_name}', Captain.",
                 ephemeral=True,
             )
-        lines = _member_name_change_lines(member)
+        lines = _member_name_change_lines(member, _rename_index(state).get(member.uuid, ()))
         return interaction_response("\n".join(lines), ephemeral=True)
 
-    members = _collect_name_change_members(state)
-    if not members:
+    lines = ["🗂 **Recorded name changes**"]
+    for name, previous in _iter_rename_candidates(state):
+        lines.append(f"- {name} (was {previous or 'Unknown'})")
+    if len(lines) == 1:
         return interaction_response(
             "🗂 No recorded name changes in the current roster.",
             ephemeral=True,
         )
 
-    lines = ["🗂 **Recorded name changes**"]
-    for member in members:
-        previous = ", ".join(member.previous_names) or "Unknown"
-        lines.append(f"- {member.name} (was {previous})")
-
     chunks = _chunk_lines(lines)
     primary = chunks[0]
     if len(chunks) > 1:
@@ -710,25 +1043,16 @@ def handle_name_changes_slash(payload: dict) -> dict:
 
 
 def handle_pull_history_slash(payload: dict) -> dict:
-    guild_id = payload.get("guild_id") or "default"
-    config = load_config()
-    selection = _get_subcommand_option(payload, "alliance")
-    alliance, alliances = _resolve_alliance_selection(config, guild_id, selection)
-    if not alliance:
-        if alliances and not selection:
-            return _prompt_alliance_selection(payload, "Pull history lookup", alliances)
-        return interaction_response(
-            _alliance_failure_message("Pull history lookup", alliances, selection),
-            ephemeral=True,
-        )
-    state = load_state(alliance.get("id", guild_id))
-    history = list(state.get("pull_history") or [])
-    if not history:
+    ctx = _prepare_context(payload, "Pull history lookup")
+    if isinstance(ctx, dict):
+        return ctx
+    state = load_state_cached(ctx.alliance_id)
+    recent = (state.get("pull_history") or ())[-5:]
+    if not recent:
         return interaction_response(
             "🧭 No pull history recorded yet.",
             ephemeral=True,
         )
-    recent = history[-5:]
     lines = ["🧭 **Last 5 pulls**"]
     for entry in recent:
         ts = _format_pull_timestamp(entry.get("timestamp"))
@@ -28,14 +28,19 @@ def full_roster_messages(
     service_state: dict | None = None,
     name_overrides: dict | None = None,
     active_names: set[str] | None = None,
+    members: List[Member] | None = None,
 ) -> List[str]:
     """Build paginated roster messages from the v2 alliance_state dict.
 
     alliance_state is expected to be the dict returned by
-    scrappystats.storage.state.load_state(alliance_id).
+    scrappystats.storage.state.load_state(alliance_id). Callers that
+    already hold the deserialized members can pass them via ``members``.
     """
-    members_raw = alliance_state.get("members", {}) or {}
-    members = _deserialize_members(members_raw)
+    if members is None:
+        members_raw = alliance_state.get("members", {}) or {}
+        members = _deserialize_members(members_raw)
+    else:
+        members = list(members)
     overrides = name_overrides or {}
     service_state = service_state or {}
     if active_names is not None:
@@ -52,9 +57,7 @@ def full_roster_messages(
     def format_join_date(value: str) -> str:
         if not value:
             return "-"
-        if "T" in value:
-            return value.split("T", 1)[0]
-        return value
+        return value.partition("T")[0]
 
     max_length = 1900
     date_width = 18
@@ -70,6 +73,9 @@ def full_roster_messages(
 
     chunks: List[str] = []
     current = build_intro(True)
+    # Length of "\n".join(current) plus one trailing newline, kept running so
+    # each line doesn't re-join the whole chunk.
+    current_len = sum(map(len, current)) + len(current)
 
     for m in members:
         lvl = m.level if isinstance(m.level, int) else int(m.level or 0)
@@ -87,11 +93,12 @@ def full_roster_messages(
             f"{display_name:<20} {m.rank:<10} {lvl:>3} {power:>8}  "
             f"{last_join:<{date_width}} {orig_join:<{date_width}}"
         )
-        tentative = "\n".join(current + [line, "```"])
-        if len(tentative) > max_length and len(current) > 4:
+        if current_len + len(line) + 4 > max_length and len(current) > 4:
             chunks.append("\n".join(current + ["```"]))
             current = build_intro(False)
+            current_len = sum(map(len, current)) + len(current)
         current.append(line)
+        current_len += len(line) + 1
 
     chunks.append("\n".join(current + ["```"]))
     return chunks
@@ -4,7 +4,7 @@
 Formats the service history for a single Member.
 """
 from datetime import date, datetime, timezone
-from typing import Literal
+from typing import Any, Literal, Mapping
 
 from ..models.member import Member
 from ..services.report_common import build_table_from_rows
@@ -23,7 +23,7 @@ def _format_timestamp(raw: str | None) -> str:
     if value.endswith("Z") and "+" in value:
         value = value[:-1]
     try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         parsed = parsed.astimezone(timezone.utc)
@@ -50,7 +50,7 @@ def _format_join_date(raw: str | None) -> str:
     if value.endswith("Z") and "+" in value:
         value = value[:-1]
     try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(value)
         return parsed.date().strftime("%b %d, %Y")
     except ValueError:
         pass
@@ -109,10 +109,10 @@ def service_record_command(
     power_today: int | None = None,
     power_7: int | None = None,
     power_30: int | None = None,
-    contributions_total: dict | None = None,
-    contributions_30: dict | None = None,
-    contributions_7: dict | None = None,
-    contributions_1: dict | None = None,
+    contributions_total: Mapping[str, Any] | None = None,
+    contributions_30: Mapping[str, Any] | None = None,
+    contributions_7: Mapping[str, Any] | None = None,
+    contributions_1: Mapping[str, Any] | None = None,
 ) -> str:
     """Return a formatted service record for the given Member instance."""
     lines = []
@@ -238,18 +238,17 @@ def _resolve_report_period(payload: dict, fallback: ReportPeriod) -> ReportPerio
     return fallback
 
 
-def _get_subcommand_option(payload: dict, option_name: str):
+def _subcommand_option_values(payload: dict) -> dict:
+    """Map option name -> value, preferring the subcommand's own options."""
     data = payload.get("data", {})
     options = data.get("options") or []
+    values = {opt.get("name"): opt.get("value") for opt in options}
     if options:
-        sub = options[0]
-        for opt in sub.get("options") or []:
-            if opt.get("name") == option_name:
-                return opt.get("value")
-    for opt in options:
-        if opt.get("name") == option_name:
-            return opt.get("value")
-    return None
+        values.update(
+            (opt.get("name"), opt.get("value"))
+            for opt in options[0].get("options") or []
+        )
+    return values
 
 
 def _alliance_label(alliance: dict) -> str:
@@ -293,8 +292,9 @@ def handle_report_slash(payload: dict, period: ReportPeriod):
     """
     guild_id = payload.get("guild_id")
     resolved_period = _resolve_report_period(payload, period)
-    player_name = _get_subcommand_option(payload, "player")
-    alliance_selection = _get_subcommand_option(payload, "alliance")
+    options = _subcommand_option_values(payload)
+    player_name = options.get("player")
+    alliance_selection = options.get("alliance")
     log.info(
         "Slash report requested: guild=%s period=%s",
         guild_id,
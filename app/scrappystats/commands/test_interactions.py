@@ -0,0 +1,33 @@
+from scrappystats.commands.interactions import _autocomplete_names, _find_member_by_name
+
+
+def _member(member_uuid: str, name: str, previous_names=()) -> dict:
+    return {
+        "uuid": member_uuid,
+        "name": name,
+        "level": 10,
+        "rank": "Agent",
+        "original_join_date": "2025-01-01T00:00:00Z",
+        "last_join_date": "2025-01-01T00:00:00Z",
+        "previous_names": list(previous_names),
+    }
+
+
+def test_player_autocomplete_entries_resolve_to_their_own_member():
+    # u003's override "Nick" collides (case-insensitively) with u008's
+    # current name; u011 was previously called "Nicky", u014's override.
+    state = {
+        "members": {
+            "u003": _member("u003", "Nicholas"),
+            "u008": _member("u008", "nick"),
+            "u011": _member("u011", "Nickolai", previous_names=["Nicky"]),
+            "u014": _member("u014", "Dominic"),
+        },
+        "name_overrides": {"g1": {"u003": "Nick", "u014": "Nicky"}},
+    }
+
+    names = [name for _, name in _autocomplete_names(state, "g1")]
+
+    assert names == ["Nicholas", "nick", "Nickolai", "Nicky"]
+    resolved = [_find_member_by_name(state, name, guild_id="g1").uuid for name in names]
+    assert resolved == ["u003", "u008", "u011", "u014"]
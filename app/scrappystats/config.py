@@ -9,6 +9,7 @@ Created on Sun Dec 14 13:49:31 2025
 import json
 import logging
 import os
+import time
 
 log = logging.getLogger(__name__)
 
@@ -27,18 +28,38 @@ def _resolve_config_path() -> str | None:
     return None
 
 
+# Re-read the file at least this often even if its stat looks unchanged
+# (coarse mtime resolution, files swapped in with preserved timestamps).
+_CONFIG_MAX_AGE = 30.0
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], float, dict]] = {}
+
+
 def load_config(*, fatal: bool = False) -> dict:
     """
     Load the ScrappyStats configuration from disk.
 
     This is the single source of truth for config loading.
+    The parsed config is cached per path and only re-read when the file's
+    mtime or size changes or the cached copy is older than _CONFIG_MAX_AGE
+    seconds, so callers must treat the returned dict as read-only.
     """
     try:
         config_path = _resolve_config_path()
         if not config_path:
             raise FileNotFoundError("No config file found")
+        st = os.stat(config_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        now = time.monotonic()
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == signature and now - cached[1] < _CONFIG_MAX_AGE:
+            return cached[2]
         with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            config = json.load(f)
+        if cached is not None and cached[2] == config:
+            # Unchanged content: keep the old object so derived caches stay valid.
+            config = cached[2]
+        _CONFIG_CACHE[config_path] = (signature, now, config)
+        return config
     except FileNotFoundError:
         log.error(
             "Config file not found. Set SCRAPPYSTATS_CONFIG or provide one of: %s",
@@ -76,18 +97,27 @@ def list_alliances(config: dict) -> list:
     return list(iter_alliances(config))
 
 
+_GUILD_INDEX_CACHE: tuple[dict, dict[str, list]] | None = None
+
+
+def _guild_index(config: dict) -> dict[str, list]:
+    """Map guild id -> alliances, built once per config object."""
+    global _GUILD_INDEX_CACHE
+    cached = _GUILD_INDEX_CACHE
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    index: dict[str, list] = {}
+    for guild in config.get("guilds") or []:
+        index.setdefault(str(guild.get("id")), guild.get("alliances", []) or [])
+    _GUILD_INDEX_CACHE = (config, index)
+    return index
+
+
 def get_guild_alliances(config: dict, guild_id: str) -> list:
     guilds = config.get("guilds") or []
     if not guilds:
         return config.get("alliances", []) or []
-
-    guild = next(
-        (g for g in guilds if str(g.get("id")) == str(guild_id)),
-        None,
-    )
-    if not guild:
-        return []
-    return guild.get("alliances", []) or []
+    return _guild_index(config).get(str(guild_id), [])
 
 
 def list_alliances_for_guild(config: dict, guild_id: str | None) -> list:
@@ -96,10 +126,35 @@ def list_alliances_for_guild(config: dict, guild_id: str | None) -> list:
     return list_alliances(config)
 
 
+_RESOLVE_CACHE: tuple[dict, dict] | None = None
+_RESOLVE_CACHE_SIZE = 256
+
+
 def resolve_alliance_for_guild(
     config: dict,
     guild_id: str | None,
     selection: str | None,
+) -> tuple[dict | None, list]:
+    """Resolve a guild's alliance selection, memoized per config object."""
+    global _RESOLVE_CACHE
+    cached = _RESOLVE_CACHE
+    if cached is None or cached[0] is not config:
+        cached = _RESOLVE_CACHE = (config, {})
+    results = cached[1]
+    key = (None if guild_id is None else str(guild_id), selection)
+    result = results.get(key)
+    if result is None:
+        if len(results) >= _RESOLVE_CACHE_SIZE:
+            # Selections are user input; keep the memo from growing unbounded.
+            results.clear()
+        result = results[key] = _resolve_alliance_for_guild(config, guild_id, selection)
+    return result
+
+
+def _resolve_alliance_for_guild(
+    config: dict,
+    guild_id: str | None,
+    selection: str | None,
 ) -> tuple[dict | None, list]:
     alliances = list_alliances_for_guild(config, guild_id)
     if selection is None:
@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+import time
 from typing import List, Dict, Any
 
 import requests
@@ -17,6 +18,8 @@ BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN", "")
 PUBLIC_KEY = os.getenv("DISCORD_PUBLIC_KEY", "")
 APPLICATION_ID = os.getenv("DISCORD_APPLICATION_ID", "")
 GUILD_ID = os.getenv("DISCORD_GUILD_ID", "")
+_SESSION = requests.Session()
+FOLLOWUP_RETRIES = 3
 
 def verify_signature(signature: str, timestamp: str, body: bytes) -> bool:
     if not PUBLIC_KEY:
@@ -84,6 +87,13 @@ def interaction_response(content: str, ephemeral: bool = True) -> dict:
         data["flags"] = 64
     return {"type": 4, "data": data}
 
+def interaction_defer_response(ephemeral: bool = True) -> dict:
+    """Acknowledge now; the content follows via send_followup_message()."""
+    data = {}
+    if ephemeral:
+        data["flags"] = 64
+    return {"type": 5, "data": data}
+
 def send_followup_message(
     application_id: str,
     token: str,
@@ -98,15 +108,45 @@ def send_followup_message(
     if ephemeral:
         payload["flags"] = 64
     try:
-        resp = requests.post(url, json=payload, timeout=10)
+        for attempt in range(FOLLOWUP_RETRIES + 1):
+            resp = _SESSION.post(url, json=payload, timeout=10)
+            if resp.status_code != 429 or attempt >= FOLLOWUP_RETRIES:
+                break
+            delay = _retry_after(resp)
+            log.warning("Followup message rate limited; retrying in %.2fs", delay)
+            time.sleep(delay)
         if resp.status_code not in (200, 204):
             log.error(
                 "Failed to send followup message: %s %s",
                 resp.status_code,
                 resp.text,
             )
+            return
+        # Followups for one interaction share a bucket; wait it out here
+        # rather than letting the next message bounce off a 429.
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            delay = _header_seconds(resp, "X-RateLimit-Reset-After")
+            if delay:
+                time.sleep(delay)
     except requests.RequestException:
         log.exception("Failed to send followup message")
 
+
+def _header_seconds(resp: requests.Response, name: str) -> float | None:
+    try:
+        return float(resp.headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _retry_after(resp: requests.Response) -> float:
+    """Seconds to wait after a 429, from the JSON body or the headers."""
+    try:
+        return float(resp.json()["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        pass
+    delay = _header_seconds(resp, "Retry-After")
+    return delay if delay is not None else 1.0
+
 def pong():
     return {"type": 1}
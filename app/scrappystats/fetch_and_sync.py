@@ -55,6 +55,7 @@ def main() -> int:
                     "id": alliance_id,
                     "scraped_members": roster,
                     "scrape_timestamp": test_timestamp,
+                    "pull_source": "test",
                 }
                 record_source = "test"
             else:
@@ -67,6 +68,7 @@ def main() -> int:
                     "id": alliance_id,
                     "scraped_members": roster,
                     "scrape_timestamp": timestamp,
+                    "pull_source": "cron",
                 }
                 record_source = "cron"
             if debug:
@@ -75,14 +77,8 @@ def main() -> int:
                     log.info("Saved raw JSON to %s", path)
                 except Exception:
                     log.exception("Failed to save raw JSON for alliance %s", alliance_id)
-            data_changed = run_alliance_sync(payload)
-            record_pull_history(
-                alliance_id,
-                payload["scrape_timestamp"],
-                True,
-                source=record_source,
-                data_changed=data_changed,
-            )
+            # Records the successful pull along with the synced state.
+            run_alliance_sync(payload)
         except Exception:
             log.exception("Failed to fetch/sync alliance %s", alliance_id)
             record_pull_history(alliance_id, timestamp, False, source=record_source)
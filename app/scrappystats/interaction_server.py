@@ -16,6 +16,7 @@ from .commands.interactions import (
     handle_pull_history_slash,
     handle_player_autocomplete,
     handle_alliance_autocomplete,
+    warm_caches,
 )
 from .interaction_state import pop_pending
 from scrappystats.config import load_config
@@ -201,6 +202,7 @@ COMMANDS = [
 @app.on_event("startup")
 async def on_startup():
     register_commands(COMMANDS)
+    warm_caches()
     log.info("Interaction server started, version %s", __version__)
     log.info(
         "Registered commands: %s",
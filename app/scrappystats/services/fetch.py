@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 import zlib
 from datetime import datetime, timezone
@@ -32,6 +33,7 @@ REQUEST_MIN_INTERVAL = float(os.getenv("SCRAPPYSTATS_REQUEST_MIN_INTERVAL", "0.5
 REQUEST_RETRIES = int(os.getenv("SCRAPPYSTATS_REQUEST_RETRIES", "2") or 2)
 REQUEST_BACKOFF_BASE = float(os.getenv("SCRAPPYSTATS_REQUEST_BACKOFF_BASE", "1.0") or 1.0)
 _LAST_REQUEST_TS = 0.0
+_THROTTLE_LOCK = threading.Lock()
 _SESSION = requests.Session()
 
 
@@ -39,11 +41,14 @@ def _sleep_if_needed() -> None:
     global _LAST_REQUEST_TS
     if REQUEST_MIN_INTERVAL <= 0:
         return
-    now = time.monotonic()
-    elapsed = now - _LAST_REQUEST_TS
-    if elapsed < REQUEST_MIN_INTERVAL:
-        time.sleep(REQUEST_MIN_INTERVAL - elapsed)
-    _LAST_REQUEST_TS = time.monotonic()
+    # Reserve the next request slot under the lock so concurrent callers
+    # (forcepulls for different guilds, detail refreshes) are spaced out too.
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        slot = max(now, _LAST_REQUEST_TS + REQUEST_MIN_INTERVAL)
+        _LAST_REQUEST_TS = slot
+    if slot > now:
+        time.sleep(slot - now)
 
 
 def _stfc_headers(headers: dict) -> dict:
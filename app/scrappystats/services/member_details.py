@@ -94,16 +94,18 @@ def set_member_detail_interval_override(
     save_state(alliance_id, state)
 
 
-def _member_index(state: dict) -> tuple[dict[str, Member], dict[str, Member]]:
+def _member_index(state: dict) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Index raw member dicts; callers deserialize only the members they pick."""
     members_raw = state.get("members", {}) or {}
-    by_name: dict[str, Member] = {}
-    by_player_id: dict[str, Member] = {}
+    by_name: dict[str, dict] = {}
+    by_player_id: dict[str, dict] = {}
     for data in members_raw.values():
-        member = Member.from_json(data)
-        if member.name:
-            by_name[member.name] = member
-        if member.player_id:
-            by_player_id[str(member.player_id)] = member
+        name = data.get("name")
+        player_id = data.get("player_id")
+        if name:
+            by_name[name] = data
+        if player_id:
+            by_player_id[str(player_id)] = data
     return by_name, by_player_id
 
 
@@ -143,24 +145,24 @@ def _select_candidate(
             if len(candidates) >= max_members:
                 remaining.append(str(pid))
                 continue
-            member = by_player_id.get(str(pid))
-            if not member:
+            data = by_player_id.get(str(pid))
+            if not data:
                 continue
             if not _eligible_for_player(str(pid)):
                 remaining.append(str(pid))
                 continue
-            candidates.append((str(pid), member))
+            candidates.append((str(pid), Member.from_json(data)))
         state[QUEUE_KEY] = remaining
         save_state(alliance_id, state)
         if candidates:
             return candidates
 
-    eligible: list[tuple[datetime, str, Member]] = []
+    eligible: list[tuple[datetime, str, dict]] = []
     for name in active_names:
-        member = by_name.get(name)
-        if not member or not member.player_id:
+        data = by_name.get(name)
+        if not data or not data.get("player_id"):
             continue
-        pid = str(member.player_id)
+        pid = str(data["player_id"])
         entry = detail_state.get(pid) or {}
         if not _eligible_by_backoff(entry.get("last_attempt")):
             continue
@@ -168,11 +170,11 @@ def _select_candidate(
         if not _eligible_by_interval(entry.get("last_success"), interval_hours=interval):
             continue
         last_success = _parse_iso(entry.get("last_success")) or datetime.min.replace(tzinfo=timezone.utc)
-        eligible.append((last_success, pid, member))
+        eligible.append((last_success, pid, data))
 
     eligible.sort(key=lambda item: item[0])
-    for _, pid, member in eligible[:max_members]:
-        candidates.append((pid, member))
+    for _, pid, data in eligible[:max_members]:
+        candidates.append((pid, Member.from_json(data)))
     return candidates
 
 
@@ -1,4 +1,7 @@
+import os
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
 from scrappystats.utils import load_json, history_snapshot_path, DATA_ROOT, HISTORY_DIR
@@ -35,75 +38,128 @@ def _parse_snapshot_ts(path: Path) -> datetime | None:
         return None
 
 
-def load_snapshot_at_or_before(alliance_id: str, target_dt: datetime) -> dict:
+_SNAPSHOT_INDEX_CACHE: dict[str, tuple[int, list[datetime], list[Path]]] = {}
+
+
+def _snapshot_index(history_dir: Path) -> tuple[list[datetime], list[Path]]:
     """
-    Load the most recent snapshot at or before the target timestamp.
+    Return the snapshot timestamps of a history directory in ascending order,
+    with their paths. The directory is scanned once and rescanned only when
+    its mtime changes (a snapshot was added or removed).
+    """
+    key = str(history_dir)
+    try:
+        mtime_ns = os.stat(history_dir).st_mtime_ns
+    except FileNotFoundError:
+        _SNAPSHOT_INDEX_CACHE.pop(key, None)
+        return [], []
+    cached = _SNAPSHOT_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    entries = []
+    with os.scandir(history_dir) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                continue
+            path = Path(entry.path)
+            ts = _parse_snapshot_ts(path)
+            if ts is not None:
+                entries.append((ts, path))
+    entries.sort(key=itemgetter(0))
+    timestamps = [ts for ts, _ in entries]
+    paths = [path for _, path in entries]
+    _SNAPSHOT_INDEX_CACHE[key] = (mtime_ns, timestamps, paths)
+    return timestamps, paths
+
+
+def forget_snapshot_index(alliance_id: str) -> None:
+    """
+    Drop the cached snapshot index for an alliance. Call after writing a
+    snapshot: the directory mtime alone can miss it on coarse filesystems.
+    """
+    _SNAPSHOT_INDEX_CACHE.pop(str(HISTORY_DIR / alliance_id), None)
+
+
+def snapshot_path_at_or_before(alliance_id: str, target_dt: datetime) -> Path | None:
+    """
+    Path of the most recent snapshot at or before the target timestamp.
     """
-    history_dir = HISTORY_DIR / alliance_id
-    if not history_dir.exists():
-        return {}
+    if target_dt.tzinfo is None:
+        target_dt = target_dt.replace(tzinfo=timezone.utc)
+
+    timestamps, paths = _snapshot_index(HISTORY_DIR / alliance_id)
+    idx = bisect_right(timestamps, target_dt) - 1
+    return paths[idx] if idx >= 0 else None
 
+
+def snapshot_path_at_or_after(alliance_id: str, target_dt: datetime) -> Path | None:
+    """
+    Path of the earliest snapshot at or after the target timestamp.
+    """
     if target_dt.tzinfo is None:
         target_dt = target_dt.replace(tzinfo=timezone.utc)
 
-    best_path: Path | None = None
-    best_ts: datetime | None = None
-    for file in history_dir.glob("*.json"):
-        ts = _parse_snapshot_ts(file)
-        if ts is None or ts > target_dt:
-            continue
-        if best_ts is None or ts > best_ts:
-            best_ts = ts
-            best_path = file
+    timestamps, paths = _snapshot_index(HISTORY_DIR / alliance_id)
+    idx = bisect_left(timestamps, target_dt)
+    return paths[idx] if idx < len(timestamps) else None
 
-    if best_path is None:
-        return {}
 
-    return load_json(best_path, {})
+def load_snapshot_at_or_before(alliance_id: str, target_dt: datetime) -> dict:
+    """
+    Load the most recent snapshot at or before the target timestamp.
+    """
+    path = snapshot_path_at_or_before(alliance_id, target_dt)
+    return load_json(path, {}) if path is not None else {}
 
 
 def load_snapshot_at_or_after(alliance_id: str, target_dt: datetime) -> dict:
     """
     Load the earliest snapshot at or after the target timestamp.
     """
-    history_dir = HISTORY_DIR / alliance_id
-    if not history_dir.exists():
-        return {}
+    path = snapshot_path_at_or_after(alliance_id, target_dt)
+    return load_json(path, {}) if path is not None else {}
 
-    if target_dt.tzinfo is None:
-        target_dt = target_dt.replace(tzinfo=timezone.utc)
 
-    best_path: Path | None = None
-    best_ts: datetime | None = None
-    for file in history_dir.glob("*.json"):
-        ts = _parse_snapshot_ts(file)
-        if ts is None or ts < target_dt:
-            continue
-        if best_ts is None or ts < best_ts:
-            best_ts = ts
-            best_path = file
+def _delta(pdata: dict, prev_p: dict) -> dict:
+    return {
+        "helps": pdata.get("helps", 0) - prev_p.get("helps", 0),
+        "rss": pdata.get("rss", 0) - prev_p.get("rss", 0),
+        "iso": pdata.get("iso", 0) - prev_p.get("iso", 0),
+        "resources_mined": pdata.get("resources_mined", 0) - prev_p.get("resources_mined", 0),
+    }
 
-    if best_path is None:
-        return {}
-
-    return load_json(best_path, {})
 
 def compute_deltas(cur: dict, prev: dict):
-    deltas = {}
-    for name, pdata in cur.items():
-        c_helps = pdata.get("helps", 0)
-        c_rss = pdata.get("rss", 0)
-        c_iso = pdata.get("iso", 0)
-        c_resources_mined = pdata.get("resources_mined", 0)
-        prev_p = prev.get(name, {})
-        d = {
-            "helps": c_helps - prev_p.get("helps", 0),
-            "rss": c_rss - prev_p.get("rss", 0),
-            "iso": c_iso - prev_p.get("iso", 0),
-            "resources_mined": c_resources_mined - prev_p.get("resources_mined", 0),
-        }
-        deltas[name] = d
-    return deltas
+    return {name: _delta(pdata, prev.get(name, {})) for name, pdata in cur.items()}
+
+
+def compute_member_delta(cur: dict, prev: dict, name: str) -> dict | None:
+    """
+    compute_deltas(cur, prev).get(name) without walking the whole roster.
+    """
+    pdata = cur.get(name)
+    if pdata is None:
+        return None
+    return _delta(pdata, prev.get(name, {}))
+
+
+def _coerce_number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        cleaned = value.replace(",", "").strip()
+        if cleaned.startswith("-"):
+            sign = -1
+            cleaned = cleaned[1:]
+        else:
+            sign = 1
+        if cleaned.isdigit():
+            return sign * int(cleaned)
+    return None
+
 
 def make_table(headers, rows, *, min_widths=None):
     """
@@ -112,36 +168,20 @@ def make_table(headers, rows, *, min_widths=None):
     if min_widths and len(min_widths) != len(headers):
         raise ValueError("min_widths must match headers length")
 
-    def coerce_number(value):
-        if isinstance(value, bool):
-            return None
-        if isinstance(value, (int, float)):
-            return value
-        if isinstance(value, str):
-            cleaned = value.replace(",", "").strip()
-            if cleaned.startswith("-"):
-                sign = -1
-                cleaned = cleaned[1:]
-            else:
-                sign = 1
-            if cleaned.isdigit():
-                return sign * int(cleaned)
-        return None
-
-    def is_number(value) -> bool:
-        return coerce_number(value) is not None
-
     if not rows:
         rows = [["No data available."] + [""] * (len(headers) - 1)]
 
     numeric_cols = []
     for idx in range(len(headers)):
         column_values = [row[idx] for row in rows if idx < len(row)]
-        numeric_cols.append(bool(column_values) and all(is_number(v) for v in column_values))
+        numeric_cols.append(
+            bool(column_values)
+            and all(_coerce_number(v) is not None for v in column_values)
+        )
 
     def format_value(value, idx):
         if numeric_cols[idx]:
-            numeric = coerce_number(value)
+            numeric = _coerce_number(value)
             if numeric is not None:
                 return format(numeric, ",")
         return str(value)
@@ -61,7 +61,7 @@ def build_service_reports(
     reports: list[tuple[str, str]] = []
 
     now = datetime.now(timezone.utc)
-    start_of_today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+    start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     if report_type == "interim":
         start_dt = start_of_today
         end_dt = now
@@ -95,9 +95,10 @@ def build_service_reports(
         member_meta_by_name = {}
         member_uuid_by_name = {}
         for data in members_raw.values():
-            member = Member.from_json(data)
-            if member.name not in active_names:
+            # Filter on the raw name so only active members get deserialized.
+            if data.get("name") not in active_names:
                 continue
+            member = Member.from_json(data)
             member_meta_by_name[member.name] = {
                 "rank": member.rank,
                 "level": member.level,
@@ -5,7 +5,12 @@ import logging
 from datetime import datetime
 from typing import Dict, List
 
-from ..storage.state import load_state, save_state, initialize_member
+from ..storage.state import (
+    append_pull_history,
+    initialize_member,
+    load_state,
+    save_state,
+)
 from ..utils import (
     load_json,
     save_json,
@@ -18,6 +23,7 @@ from .detection import detect_member_events
 from .service_record import add_service_event
 from .events import dispatch_webhook_events
 from .member_details import queue_member_detail_refresh
+from .report_common import forget_snapshot_index
 
 log = logging.getLogger(__name__)
 
@@ -138,6 +144,8 @@ def sync_alliance(alliance_cfg: dict) -> bool:
           - rank: str
           - level: int
           - join_date: 'YYYY-MM-DD' (from STFC.pro)
+      - pull_source: str        (optional; records a successful pull in the
+                                 same state write)
     """
     alliance_id = alliance_cfg.get("id", "default")
     alliance_name = alliance_cfg.get("alliance_name")
@@ -408,18 +416,37 @@ def sync_alliance(alliance_cfg: dict) -> bool:
 
     state["members"] = _serialize_members(final_members)
     state["last_sync"] = scrape_timestamp
-    save_state(alliance_id, state)
 
     report_state = report_state_path(alliance_id)
     history_snapshot = history_snapshot_path(alliance_id, scrape_timestamp)
-    save_json(report_state, service_state)
-    save_json(history_snapshot, service_state)
+    try:
+        save_json(report_state, service_state)
+        save_json(history_snapshot, service_state)
+        forget_snapshot_index(alliance_id)
+    except Exception:
+        # Events were already dispatched: keep the synced members so the next
+        # pull doesn't announce them again, but don't record a success.
+        save_state(alliance_id, state)
+        raise
     log.info(
         "Saved service state for alliance %s (current=%s, snapshot=%s)",
         alliance_id,
         report_state,
         history_snapshot,
     )
+
+    # Only record the pull as successful once the service state and snapshot
+    # are on disk; the member state is saved last so it carries the entry.
+    pull_source = alliance_cfg.get("pull_source")
+    if pull_source:
+        append_pull_history(
+            state,
+            scrape_timestamp,
+            True,
+            source=pull_source,
+            data_changed=data_changed,
+        )
+    save_state(alliance_id, state)
     return data_changed
 
 # def run_alliance_sync(alliance: dict) -> None:
@@ -452,6 +479,7 @@ def run_alliance_sync(alliance: dict) -> bool:
         "alliance_name": alliance.get("alliance_name"),
         "scraped_members": scraped_members,
         "scrape_timestamp": scrape_timestamp,
+        "pull_source": alliance.get("pull_source"),
     }
 
     return sync_alliance(cfg)
@@ -1,4 +1,15 @@
-from scrappystats.services.report_common import build_table_from_rows
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from scrappystats.services import report_common
+from scrappystats.services.report_common import (
+    build_table_from_rows,
+    forget_snapshot_index,
+    snapshot_path_at_or_after,
+    snapshot_path_at_or_before,
+)
 
 
 def test_build_table_from_rows_tolerates_missing_and_extra_columns():
@@ -15,3 +26,63 @@ def test_build_table_from_rows_tolerates_missing_and_extra_columns():
 
     assert "Name" in table
     assert "Score" in table
+
+
+def _utc(day: int, hour: int = 0) -> datetime:
+    return datetime(2025, 3, day, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def history_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_common, "HISTORY_DIR", tmp_path)
+    alliance_dir = tmp_path / "A1"
+    alliance_dir.mkdir()
+    for day in (1, 3, 5):
+        (alliance_dir / f"2025-03-0{day}T00:00:00Z.json").write_text("{}")
+    (alliance_dir / "notes.txt").write_text("ignored")
+    return alliance_dir
+
+
+def test_snapshot_lookup_exact_match(history_dir):
+    exact = history_dir / "2025-03-03T00:00:00Z.json"
+    assert snapshot_path_at_or_before("A1", _utc(3)) == exact
+    assert snapshot_path_at_or_after("A1", _utc(3)) == exact
+
+
+def test_snapshot_lookup_between_snapshots(history_dir):
+    assert snapshot_path_at_or_before("A1", _utc(4)).name == "2025-03-03T00:00:00Z.json"
+    assert snapshot_path_at_or_after("A1", _utc(4)).name == "2025-03-05T00:00:00Z.json"
+
+
+def test_snapshot_lookup_outside_range(history_dir):
+    assert snapshot_path_at_or_before("A1", datetime(2025, 2, 28)) is None
+    assert snapshot_path_at_or_after("A1", _utc(1)).name == "2025-03-01T00:00:00Z.json"
+    assert snapshot_path_at_or_before("A1", _utc(9)).name == "2025-03-05T00:00:00Z.json"
+    assert snapshot_path_at_or_after("A1", _utc(5, 1)) is None
+
+
+def test_snapshot_lookup_empty_or_missing_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_common, "HISTORY_DIR", tmp_path)
+    (tmp_path / "EMPTY").mkdir()
+    for alliance_id in ("EMPTY", "MISSING"):
+        assert snapshot_path_at_or_before(alliance_id, _utc(3)) is None
+        assert snapshot_path_at_or_after(alliance_id, _utc(3)) is None
+
+
+def test_snapshot_index_picks_up_new_snapshot(history_dir):
+    assert snapshot_path_at_or_after("A1", _utc(6)) is None
+    (history_dir / "2025-03-07T00:00:00Z.json").write_text("{}")
+    forget_snapshot_index("A1")
+    assert snapshot_path_at_or_after("A1", _utc(6)).name == "2025-03-07T00:00:00Z.json"
+    assert snapshot_path_at_or_before("A1", _utc(9)).name == "2025-03-07T00:00:00Z.json"
+
+
+def test_forget_snapshot_index_covers_unchanged_directory_mtime(history_dir):
+    assert snapshot_path_at_or_before("A1", _utc(9)).name == "2025-03-05T00:00:00Z.json"
+    st = os.stat(history_dir)
+    (history_dir / "2025-03-07T00:00:00Z.json").write_text("{}")
+    # Same-tick write on a coarse-timestamp filesystem: the mtime doesn't move.
+    os.utime(history_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    forget_snapshot_index("A1")
+    assert snapshot_path_at_or_after("A1", _utc(6)).name == "2025-03-07T00:00:00Z.json"
+    assert snapshot_path_at_or_before("A1", _utc(9)).name == "2025-03-07T00:00:00Z.json"
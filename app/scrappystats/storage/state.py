@@ -1,12 +1,13 @@
 
 import json
 import os
+import threading
 import uuid
 from typing import Optional
 
 from .files import ensure_data_dir, state_path
 from ..models.member import Member
-from ..utils import iso_now
+from ..utils import iso_now, parse_json
 
 def load_state(alliance_id: str) -> dict:
     """Load JSON state for the given alliance_id.
@@ -25,8 +26,61 @@ def load_state(alliance_id: str) -> dict:
             "members": {},
             "pull_history": [],
         }
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return parse_json(f.read())
+
+# alliance_id -> (stat signature, parsed state)
+_STATE_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+# id(cached state) -> (state, scratch for derived data); kept in step with
+# _STATE_CACHE so a scratch never outlives its state's cache entry.
+_STATE_SCRATCH: dict[int, tuple[dict, dict]] = {}
+_STATE_CACHE_LOCK = threading.Lock()
+
+
+def _evict_cached_state(key: str) -> None:
+    """Drop an alliance's cache entry and its scratch; caller holds the lock."""
+    cached = _STATE_CACHE.pop(key, None)
+    if cached is not None:
+        _STATE_SCRATCH.pop(id(cached[1]), None)
+
+
+def load_state_cached(alliance_id: str) -> dict:
+    """Read-only variant of load_state() for interaction handlers.
+
+    The parsed state is shared between callers and only re-read when the
+    file's mtime or size changes, so it must not be mutated. Anything that saves
+    state should keep using load_state().
+    """
+    path = state_path(alliance_id)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return load_state(alliance_id)
+    signature = (st.st_mtime_ns, st.st_size)
+    key = str(alliance_id)
+    cached = _STATE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    state = load_state(alliance_id)
+    with _STATE_CACHE_LOCK:
+        _evict_cached_state(key)
+        _STATE_CACHE[key] = (signature, state)
+        _STATE_SCRATCH[id(state)] = (state, {})
+    return state
+
+
+def state_scratch(state: dict) -> dict:
+    """Scratch dict for data derived from a load_state_cached() result.
+
+    The scratch belongs to the alliance's cache entry, so it is dropped
+    together with the state once the file changes. States that are not
+    cached (e.g. an alliance without a state file yet) get a throwaway dict.
+    """
+    entry = _STATE_SCRATCH.get(id(state))
+    if entry is not None and entry[0] is state:
+        return entry[1]
+    return {}
+
 
 def save_state(alliance_id: str, state: dict) -> None:
     """Persist state to disk for the given alliance_id."""
@@ -34,6 +88,10 @@ def save_state(alliance_id: str, state: dict) -> None:
     path = state_path(alliance_id)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(state, f, indent=2, sort_keys=True)
+    # Don't rely on the stat signature alone: a same-size save within the
+    # filesystem's timestamp granularity could otherwise go unnoticed.
+    with _STATE_CACHE_LOCK:
+        _evict_cached_state(str(alliance_id))
 
 
 def record_pull_history(
@@ -45,6 +103,18 @@ def record_pull_history(
 ) -> None:
     """Record a pull attempt for the given alliance."""
     state = load_state(alliance_id)
+    append_pull_history(state, timestamp, success, source, data_changed)
+    save_state(alliance_id, state)
+
+
+def append_pull_history(
+    state: dict,
+    timestamp: Optional[str],
+    success: bool,
+    source: Optional[str] = None,
+    data_changed: Optional[bool] = None,
+) -> None:
+    """Add a pull attempt to an already-loaded state, keeping the last 20."""
     history = state.get("pull_history") or []
     entry = {
         "timestamp": timestamp or iso_now(),
@@ -56,7 +126,6 @@ def record_pull_history(
         entry["data_changed"] = bool(data_changed)
     history.append(entry)
     state["pull_history"] = history[-20:]
-    save_state(alliance_id, state)
 
 def get_guild_name_overrides(state: dict, guild_id: Optional[str]) -> dict:
     if not guild_id:
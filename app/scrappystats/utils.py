@@ -5,6 +5,11 @@ from datetime import datetime, timezone, timedelta
 
 from .config import load_config, list_alliances
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when it is missing
+    orjson = None
+
 DATA_ROOT = Path(os.environ.get("SCRAPPYSTATS_DATA_ROOT", "/data"))
 
 STATE_DIR = DATA_ROOT / "state"
@@ -53,10 +58,19 @@ def iso_now():
 def parse_iso(ts: str) -> datetime:
     return datetime.strptime(ts, ISO_FORMAT).replace(tzinfo=timezone.utc)
 
+def parse_json(raw: bytes):
+    """Parse JSON bytes, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, which only the stdlib parser accepts
+    return json.loads(raw)
+
 def load_json(path, default):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return parse_json(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         return default
 
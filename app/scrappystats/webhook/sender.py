@@ -11,6 +11,7 @@ log = logging.getLogger("scrappystats.webhook")
 DEFAULT_TIMEOUT = 10
 _WEBHOOK_ENV_VARS = ("DISCORD_WEBHOOK_URL",)
 MAX_CONTENT_LEN = 1900
+_SESSION = requests.Session()
 
 
 def _get_webhook_url(*, alliance_id: Optional[str] = None) -> Optional[str]:
@@ -111,7 +112,7 @@ def post_webhook_message(content: str, *, alliance_id: Optional[str] = None) ->
         log.info("[webhook] Sending message (%d chars, %d chunk(s))", len(content), len(chunks))
         for idx, chunk in enumerate(chunks, start=1):
             payload = {"content": chunk}
-            resp = requests.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+            resp = _SESSION.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
 
             if resp.status_code >= 400:
                 log.error(